@@ -137,6 +137,9 @@ class Settings(BaseSettings):
     jwt_expiration_hours: int = Field(
         default=24, description="JWT token expiration in hours"
     )
+    password_hash_rounds: int = Field(
+        default=12, description="BCrypt cost factor for password hashing"
+    )
 
     # Database
     database_url: str = Field(
@@ -5,12 +5,16 @@ These models define the configuration and state of ephemeral Splunk instances
 that mimic Splunk Cloud Victoria Experience.
 """
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Literal
+from typing import ClassVar, Literal
 
 from pydantic import BaseModel, Field
 
+# DNS-safe instance name: lowercase alphanumerics and hyphens, no leading/trailing hyphen
+_INSTANCE_NAME_PATTERN = r"^[a-z][a-z0-9-]*[a-z0-9]$"
+
 
 class InstanceStatus(str, Enum):
     """Status of an ephemeral Splunk instance."""
@@ -142,11 +146,14 @@ class InstanceConfig(BaseModel):
 class InstanceCreate(BaseModel):
     """Request model for creating a new ephemeral instance."""
 
+    # Compiled ``name`` pattern, for checking the character rule without a model
+    _NAME_RE: ClassVar[re.Pattern[str]] = re.compile(_INSTANCE_NAME_PATTERN)
+
     name: str = Field(
         ...,
         min_length=1,
         max_length=63,
-        pattern=r"^[a-z][a-z0-9-]*[a-z0-9]$",
+        pattern=_INSTANCE_NAME_PATTERN,
         description="Instance name (DNS-safe)",
     )
     config: InstanceConfig = Field(
@@ -36,7 +36,11 @@ class AuthService:
     """
 
     def __init__(self) -> None:
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=settings.password_hash_rounds,
+        )
         self._secret_key = settings.jwt_secret_key.get_secret_value()
         self._algorithm = settings.jwt_algorithm
         self._expiration_hours = settings.jwt_expiration_hours
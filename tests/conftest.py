@@ -11,7 +11,7 @@ This module ensures 100% deterministic test execution through:
 import asyncio
 import os
 import random
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock
@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from faker import Faker
 from httpx import ASGITransport, AsyncClient
+from starlette.testclient import TestClient
 
 # Set deterministic seeds BEFORE any other imports that might use random
 RANDOM_SEED = 42
@@ -81,6 +82,44 @@ def test_settings(test_data_dir: Path) -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def app():
+    """Create the FastAPI application once for the test session."""
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app) -> Generator[TestClient, None, None]:
+    """
+    Synchronous HTTP client for BDD step definitions.
+
+    pytest-bdd does not await async step functions, so steps drive the app
+    through Starlette's TestClient. The client is entered once per session,
+    so the app lifespan runs once rather than once per scenario or step.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+async def async_client(app) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Async HTTP client for API testing.
+
+    Uses ASGI transport to test without network calls. Opened once per
+    session; requests carry their own headers, so nothing leaks between tests.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def fixed_datetime() -> datetime:
+    """A fixed datetime for deterministic time-based tests (immutable, so shared)."""
+    return datetime(2025, 1, 30, 12, 0, 0)
+
+
 # =============================================================================
 # Function-Scoped Fixtures (Fresh per test)
 # =============================================================================
@@ -102,30 +141,6 @@ def frozen_time():
     return freeze_time
 
 
-@pytest.fixture
-def fixed_datetime() -> datetime:
-    """A fixed datetime for deterministic time-based tests."""
-    return datetime(2025, 1, 30, 12, 0, 0)
-
-
-@pytest.fixture
-def app():
-    """Create a fresh FastAPI application for testing."""
-    return create_app()
-
-
-@pytest.fixture
-async def async_client(app) -> AsyncGenerator[AsyncClient, None]:
-    """
-    Async HTTP client for API testing.
-
-    Uses ASGI transport to test without network calls.
-    """
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
-
-
 # =============================================================================
 # Mock Fixtures
 # =============================================================================
@@ -141,13 +156,23 @@ def mock_docker_client() -> MagicMock:
     return mock
 
 
-@pytest.fixture
-def mock_instance_manager() -> AsyncMock:
-    """Mock instance manager for isolated API testing."""
-    mock = AsyncMock()
+def _prime_instance_manager(mock: AsyncMock) -> None:
+    """Apply the default return values of the mock instance manager."""
     mock.list_instances.return_value = []
     mock.get_instance.return_value = None
     mock.create_instance.return_value = None
+
+
+@pytest.fixture(scope="session")
+def mock_instance_manager() -> AsyncMock:
+    """
+    Mock instance manager for isolated API testing.
+
+    Built once per session; ``reset_instance_manager`` restores it after
+    every test so return values set by one scenario never leak into the next.
+    """
+    mock = AsyncMock()
+    _prime_instance_manager(mock)
     return mock
 
 
@@ -208,11 +233,46 @@ def make_instance_create(make_instance_config):
     return _make
 
 
+@pytest.fixture(scope="session")
+def base_instance(fixed_datetime) -> Instance:
+    """
+    Fully validated Instance that ``make_instance`` copies from.
+
+    Built once per session; treat it as read-only.
+    """
+    return Instance(
+        id="fsc-test-base",
+        name="base-instance",
+        status=InstanceStatus.RUNNING,
+        config=InstanceConfig(),
+        created_at=fixed_datetime,
+        expires_at=fixed_datetime + timedelta(hours=24),
+        endpoints=InstanceEndpoints(
+            web_url="http://localhost:8000",
+            api_url="http://localhost:8089",
+            hec_url="http://localhost:8088",
+            acs_url="http://localhost:8899/fsc-test-base/adminconfig/v2",
+        ),
+        credentials=InstanceCredentials(
+            admin_username="admin",
+            admin_password="TestPassword123!",
+            acs_token="test-acs-token",
+            hec_token="test-hec-token",
+        ),
+    )
+
+
 @pytest.fixture
-def make_instance(fixed_datetime, make_instance_config):
-    """Factory for creating complete Instance objects."""
-    from datetime import timedelta
+def make_instance(base_instance):
+    """
+    Factory for creating complete Instance objects.
 
+    Copies the session's ``base_instance`` with ``model_copy`` rather than
+    re-validating a full model per call. ``model_copy`` is shallow, so every
+    mutable field (config, labels, container and volume lists) is replaced
+    with a fresh one, and endpoints and credentials are derived from the
+    per-call counter and id, as a freshly built instance would have them.
+    """
     counter = 0
 
     def _make(
@@ -224,33 +284,59 @@ def make_instance(fixed_datetime, make_instance_config):
         counter += 1
 
         instance_id = kwargs.pop("id", f"fsc-test-{counter:04d}")
-        instance_name = name or f"test-instance-{counter}"
 
-        return Instance(
-            id=instance_id,
-            name=instance_name,
-            status=status,
-            config=kwargs.pop("config", make_instance_config()),
-            created_at=fixed_datetime,
-            expires_at=fixed_datetime + timedelta(hours=24),
-            endpoints=InstanceEndpoints(
-                web_url=f"http://localhost:{8000 + counter}",
-                api_url=f"http://localhost:{8089 + counter}",
-                hec_url=f"http://localhost:{8088 + counter}",
-                acs_url=f"http://localhost:8899/{instance_id}/adminconfig/v2",
-            ),
-            credentials=InstanceCredentials(
-                admin_username="admin",
-                admin_password="TestPassword123!",
-                acs_token=f"test-acs-token-{counter}",
-                hec_token=f"test-hec-token-{counter}",
-            ),
-            **kwargs,
+        return base_instance.model_copy(
+            update={
+                "id": instance_id,
+                "name": name or f"test-instance-{counter}",
+                "status": status,
+                "config": base_instance.config.model_copy(deep=True),
+                "labels": {},
+                "container_ids": [],
+                "volume_ids": [],
+                "endpoints": base_instance.endpoints.model_copy(
+                    update={
+                        "web_url": f"http://localhost:{8000 + counter}",
+                        "api_url": f"http://localhost:{8089 + counter}",
+                        "hec_url": f"http://localhost:{8088 + counter}",
+                        "acs_url": f"http://localhost:8899/{instance_id}/adminconfig/v2",
+                    }
+                ),
+                "credentials": base_instance.credentials.model_copy(
+                    update={
+                        "acs_token": f"test-acs-token-{counter}",
+                        "hec_token": f"test-hec-token-{counter}",
+                    }
+                ),
+                **kwargs,
+            }
         )
 
     return _make
 
 
+@pytest.fixture
+def make_instances(make_instance):
+    """
+    Factory for creating several Instance objects from ``name``/``status`` rows.
+
+    Each row goes through ``make_instance``, so every instance gets its own
+    config, endpoints, credentials, labels and container lists.
+    """
+
+    def _make(rows: list[dict[str, str]]) -> list[Instance]:
+        return [
+            make_instance(
+                id=f"fsc-test-{row['name']}",
+                name=row["name"],
+                status=InstanceStatus(row["status"].lower()),
+            )
+            for row in rows
+        ]
+
+    return _make
+
+
 # =============================================================================
 # Attack Simulation Fixtures
 # =============================================================================
@@ -272,6 +358,7 @@ def make_threat_actor():
     """Factory for creating ThreatActorProfile objects."""
     from faux_splunk_cloud.attack_simulation import (
         Motivation,
+        Tactic,
         ThreatActorProfile,
         ThreatLevel,
     )
@@ -292,6 +379,15 @@ def make_threat_actor():
             description=kwargs.get("description", "Test threat actor"),
             techniques=kwargs.get("techniques", ["T1566", "T1059", "T1078"]),
             target_sectors=kwargs.get("target_sectors", []),
+            preferred_tactics=kwargs.get(
+                "preferred_tactics",
+                [Tactic.INITIAL_ACCESS, Tactic.EXECUTION, Tactic.PERSISTENCE],
+            ),
+            dwell_time_days=kwargs.get("dwell_time_days", (30, 180)),
+            noise_level=kwargs.get("noise_level", 0.2),
+            persistence_likelihood=kwargs.get("persistence_likelihood", 0.9),
+            lateral_movement_likelihood=kwargs.get("lateral_movement_likelihood", 0.8),
+            exfiltration_likelihood=kwargs.get("exfiltration_likelihood", 0.9),
         )
 
     return _make
@@ -425,6 +521,14 @@ def reset_random_seed():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_instance_manager(mock_instance_manager: AsyncMock):
+    """Reset the shared mock instance manager after each test."""
+    yield
+    mock_instance_manager.reset_mock(return_value=True, side_effect=True)
+    _prime_instance_manager(mock_instance_manager)
+
+
 @pytest.fixture(autouse=True)
 def clean_environment():
     """Ensure clean environment variables for each test."""
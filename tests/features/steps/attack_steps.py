@@ -9,12 +9,83 @@ from datetime import datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
 
+from faux_splunk_cloud.attack_simulation import CampaignStatus
+from faux_splunk_cloud.models.instance import InstanceStatus
+
 # Load all scenarios from the feature file
 scenarios("../attack_simulation.feature")
 
+# Status strings from the feature files map straight to enum members
+_STATUS_BY_VALUE = {s.value: s for s in InstanceStatus}
+_CAMPAIGN_STATUS_BY_VALUE = {s.value: s for s in CampaignStatus}
+
+# Canned log entry returned by the mocked engine; shared because it is never mutated
+_LOG_TEMPLATE = {
+    "timestamp": "2025-01-30T12:00:00Z",
+    "sourcetype": "WinEventLog:Security",
+    "event": "test",
+}
+
+def _json(context: dict) -> Any:
+    """Decode the current response body, caching the result on the response."""
+    response = context["response"]
+    if not hasattr(response, "_cached_json"):
+        response._cached_json = orjson.loads(response.content)
+    return response._cached_json
+
+
+def _remember_campaign(context: dict, campaign) -> None:
+    """Store a campaign by name and ID, and index it by target instance."""
+    context["campaigns"][campaign.name] = campaign
+    context["campaigns"][campaign.id] = campaign
+    context["campaigns_by_instance"].setdefault(campaign.target_instance_id, []).append(
+        campaign
+    )
+
+
+@pytest.fixture(autouse=True)
+def prepared_engine(mock_kill_chain_engine):
+    """
+    Install the mocked kill chain engine for the whole scenario.
+
+    Return values shared by every step are wired here once; steps only
+    override the ones that depend on the scenario's campaigns.
+    """
+    mock_kill_chain_engine.start_campaign.return_value = None
+    mock_kill_chain_engine.pause_campaign.return_value = None
+    with patch(
+        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
+        mock_kill_chain_engine,
+    ):
+        yield mock_kill_chain_engine
+
+
+@pytest.fixture
+def mock_actor():
+    """
+    Factory for threat actor mocks, one per actor ID within a scenario.
+
+    Scenario-scoped so call history and attributes set by a route never
+    leak into the next scenario.
+    """
+    actors: dict[str, MagicMock] = {}
+
+    def _get(actor_id: str) -> MagicMock:
+        actor = actors.get(actor_id)
+        if actor is None:
+            actor = actors[actor_id] = MagicMock(
+                id=actor_id,
+                name=actor_id.upper(),
+                threat_level=MagicMock(value="nation_state"),
+            )
+        return actor
+
+    return _get
+
 
 # =============================================================================
 # Given Steps (Preconditions)
@@ -27,6 +98,7 @@ def api_server_running(context: dict, app) -> None:
     context["app"] = app
     context["response"] = None
     context["campaigns"] = {}
+    context["campaigns_by_instance"] = {}
     context["instances"] = {}
 
 
@@ -39,69 +111,54 @@ def authenticated_as_security_analyst(context: dict) -> None:
     }
 
 
-@given(parsers.parse('a running instance "{name}" exists'))
+@given(parsers.re(r'a running instance "(?P<name>[^"]+)" exists'))
 def running_instance_exists(context: dict, name: str, make_instance) -> None:
     """Create a running instance for targeting."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
     instance = make_instance(name=name, status=InstanceStatus.RUNNING)
     context["instances"][name] = instance
     context["instances"][instance.id] = instance
 
 
-@given(parsers.parse('an instance "{name}" exists in "{status}" state'))
+@given(parsers.re(r'an instance "(?P<name>[^"]+)" exists in "(?P<status>[^"]+)" state'))
 def instance_exists_with_status(
     context: dict, name: str, status: str, make_instance
 ) -> None:
     """Create an instance with the specified status."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
-    status_enum = InstanceStatus(status.lower())
+    status_enum = _STATUS_BY_VALUE[status.lower()]
     instance = make_instance(name=name, status=status_enum)
     context["instances"][name] = instance
     context["instances"][instance.id] = instance
 
 
-@given(parsers.parse('a campaign "{name}" exists in "{status}" state'))
+@given(parsers.re(r'a campaign "(?P<name>[^"]+)" exists in "(?P<status>[^"]+)" state'))
 def campaign_exists_with_status(
     context: dict, name: str, status: str, make_campaign
 ) -> None:
     """Create a campaign with the specified status."""
-    from faux_splunk_cloud.attack_simulation import CampaignStatus
-
-    status_enum = CampaignStatus(status.lower())
+    status_enum = _CAMPAIGN_STATUS_BY_VALUE[status.lower()]
     campaign = make_campaign(name=name, status=status_enum)
-    context["campaigns"][name] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
 
 
-@given(parsers.parse('a campaign "{name}" exists with executed steps'))
+@given(parsers.re(r'a campaign "(?P<name>[^"]+)" exists with executed steps'))
 def campaign_exists_with_steps(context: dict, name: str, make_campaign) -> None:
     """Create a campaign with some executed steps."""
-    from faux_splunk_cloud.attack_simulation import CampaignStatus
-
     campaign = make_campaign(name=name, status=CampaignStatus.RUNNING, with_steps=True)
-    context["campaigns"][name] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
 
 
-@given(parsers.parse('a campaign "{name}" exists with generated logs'))
+@given(parsers.re(r'a campaign "(?P<name>[^"]+)" exists with generated logs'))
 def campaign_exists_with_logs(context: dict, name: str, make_campaign) -> None:
     """Create a campaign with generated logs."""
-    from faux_splunk_cloud.attack_simulation import CampaignStatus
-
     campaign = make_campaign(name=name, status=CampaignStatus.RUNNING, with_logs=True)
-    context["campaigns"][name] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
 
 
-@given(parsers.parse('multiple campaigns exist for instance "{name}"'))
+@given(parsers.re(r'multiple campaigns exist for instance "(?P<name>[^"]+)"'))
 def multiple_campaigns_for_instance(
     context: dict, name: str, make_campaign, make_instance
 ) -> None:
     """Create multiple campaigns targeting the same instance."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
     # Create the target instance
     instance = make_instance(name=name, status=InstanceStatus.RUNNING)
     context["instances"][name] = instance
@@ -112,11 +169,10 @@ def multiple_campaigns_for_instance(
         campaign = make_campaign(
             name=f"campaign-{i}", target_instance_id=instance.id
         )
-        context["campaigns"][campaign.name] = campaign
-        context["campaigns"][campaign.id] = campaign
+        _remember_campaign(context, campaign)
 
 
-@given(parsers.parse('a campaign "{name}" targeting "{instance_name}" with threat actor "{actor_id}"'))
+@given(parsers.re(r'a campaign "(?P<name>[^"]+)" targeting "(?P<instance_name>[^"]+)" with threat actor "(?P<actor_id>[^"]+)"'))
 def campaign_with_threat_actor(
     context: dict,
     name: str,
@@ -130,24 +186,21 @@ def campaign_with_threat_actor(
     campaign = make_campaign(
         name=name, target_instance_id=target_id, threat_actor_id=actor_id
     )
-    context["campaigns"][name] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
 
 
-@given(parsers.parse('a campaign "{name}" with high detection probability'))
+@given(parsers.re(r'a campaign "(?P<name>[^"]+)" with high detection probability'))
 def campaign_with_high_detection(context: dict, name: str, make_campaign) -> None:
     """Create a campaign with high detection probability."""
     campaign = make_campaign(name=name, detection_probability=0.95)
-    context["campaigns"][name] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
 
 
-@given(parsers.parse("a campaign with threat actor \"{actor_id}\""))
+@given(parsers.re(r'a campaign with threat actor "(?P<actor_id>[^"]+)"'))
 def campaign_with_actor(context: dict, actor_id: str, make_campaign) -> None:
     """Create a campaign with a specific threat actor."""
     campaign = make_campaign(name="test-campaign", threat_actor_id=actor_id)
-    context["campaigns"]["test-campaign"] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
     context["current_campaign"] = campaign
 
 
@@ -155,8 +208,7 @@ def campaign_with_actor(context: dict, actor_id: str, make_campaign) -> None:
 def campaign_for_data_source(context: dict, data_source: str, make_campaign) -> None:
     """Create a campaign configured for a specific data source."""
     campaign = make_campaign(name="data-source-test", data_sources=[data_source])
-    context["campaigns"]["data-source-test"] = campaign
-    context["campaigns"][campaign.id] = campaign
+    _remember_campaign(context, campaign)
     context["current_campaign"] = campaign
 
 
@@ -187,7 +239,7 @@ async def list_threat_actors_by_level(
     context["response"] = response
 
 
-@when(parsers.parse('I get threat actor "{actor_id}"'))
+@when(parsers.re(r'I get threat actor "(?P<actor_id>[^"]+)"'))
 async def get_threat_actor(context: dict, actor_id: str, async_client) -> None:
     """Get a specific threat actor."""
     response = await async_client.get(
@@ -197,7 +249,7 @@ async def get_threat_actor(context: dict, actor_id: str, async_client) -> None:
     context["response"] = response
 
 
-@when(parsers.parse('I create a campaign with threat actor "{actor_id}" targeting "{target}"'))
+@when(parsers.re(r'I create a campaign with threat actor "(?P<actor_id>[^"]+)" targeting "(?P<target>[^"]+)"'))
 async def create_campaign_with_actor(
     context: dict,
     actor_id: str,
@@ -205,6 +257,7 @@ async def create_campaign_with_actor(
     async_client,
     mock_kill_chain_engine,
     make_campaign,
+    mock_actor,
 ) -> None:
     """Create a campaign with a specific threat actor."""
     instance = context["instances"].get(target)
@@ -219,20 +272,12 @@ async def create_campaign_with_actor(
     mock_kill_chain_engine.get_campaign.return_value = campaign
 
     with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ), patch(
         "faux_splunk_cloud.api.routes.attacks.get_threat_actor_by_id"
     ) as mock_get_actor:
         # Mock threat actor lookup
-        if actor_id.startswith("invalid"):
-            mock_get_actor.return_value = None
-        else:
-            mock_get_actor.return_value = MagicMock(
-                id=actor_id,
-                name=actor_id.upper(),
-                threat_level=MagicMock(value="nation_state"),
-            )
+        mock_get_actor.return_value = (
+            None if actor_id.startswith("invalid") else mock_actor(actor_id)
+        )
 
         response = await async_client.post(
             "/api/v1/attacks/campaigns",
@@ -248,7 +293,7 @@ async def create_campaign_with_actor(
         context["created_campaign"] = campaign
 
 
-@when(parsers.parse('I start the campaign "{name}"'))
+@when(parsers.re(r'I start the campaign "(?P<name>[^"]+)"'))
 async def start_campaign(
     context: dict, name: str, async_client, mock_kill_chain_engine
 ) -> None:
@@ -257,25 +302,19 @@ async def start_campaign(
 
     if campaign:
         mock_kill_chain_engine.get_campaign.return_value = campaign
-        mock_kill_chain_engine.start_campaign.return_value = None
         # Update status after start
-        from faux_splunk_cloud.attack_simulation import CampaignStatus
         campaign.status = CampaignStatus.RUNNING
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        campaign_id = campaign.id if campaign else name
-        response = await async_client.post(
-            f"/api/v1/attacks/campaigns/{campaign_id}/start",
-            headers=context.get("auth_headers", {}),
-        )
+    campaign_id = campaign.id if campaign else name
+    response = await async_client.post(
+        f"/api/v1/attacks/campaigns/{campaign_id}/start",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
 
-@when(parsers.parse('I pause the campaign "{name}"'))
+@when(parsers.re(r'I pause the campaign "(?P<name>[^"]+)"'))
 async def pause_campaign(
     context: dict, name: str, async_client, mock_kill_chain_engine
 ) -> None:
@@ -284,25 +323,19 @@ async def pause_campaign(
 
     if campaign:
         mock_kill_chain_engine.get_campaign.return_value = campaign
-        mock_kill_chain_engine.pause_campaign.return_value = None
         # Update status after pause
-        from faux_splunk_cloud.attack_simulation import CampaignStatus
         campaign.status = CampaignStatus.PAUSED
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        campaign_id = campaign.id if campaign else name
-        response = await async_client.post(
-            f"/api/v1/attacks/campaigns/{campaign_id}/pause",
-            headers=context.get("auth_headers", {}),
-        )
+    campaign_id = campaign.id if campaign else name
+    response = await async_client.post(
+        f"/api/v1/attacks/campaigns/{campaign_id}/pause",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
 
-@when(parsers.parse('I get campaign "{name}"'))
+@when(parsers.re(r'I get campaign "(?P<name>[^"]+)"'))
 async def get_campaign(
     context: dict, name: str, async_client, mock_kill_chain_engine
 ) -> None:
@@ -310,20 +343,16 @@ async def get_campaign(
     campaign = context["campaigns"].get(name)
     mock_kill_chain_engine.get_campaign.return_value = campaign
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        campaign_id = campaign.id if campaign else name
-        response = await async_client.get(
-            f"/api/v1/attacks/campaigns/{campaign_id}",
-            headers=context.get("auth_headers", {}),
-        )
+    campaign_id = campaign.id if campaign else name
+    response = await async_client.get(
+        f"/api/v1/attacks/campaigns/{campaign_id}",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
 
-@when(parsers.parse('I get steps for campaign "{name}"'))
+@when(parsers.re(r'I get steps for campaign "(?P<name>[^"]+)"'))
 async def get_campaign_steps(
     context: dict, name: str, async_client, mock_kill_chain_engine
 ) -> None:
@@ -331,15 +360,11 @@ async def get_campaign_steps(
     campaign = context["campaigns"].get(name)
     mock_kill_chain_engine.get_campaign.return_value = campaign
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        campaign_id = campaign.id if campaign else name
-        response = await async_client.get(
-            f"/api/v1/attacks/campaigns/{campaign_id}/steps",
-            headers=context.get("auth_headers", {}),
-        )
+    campaign_id = campaign.id if campaign else name
+    response = await async_client.get(
+        f"/api/v1/attacks/campaigns/{campaign_id}/steps",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
@@ -351,25 +376,18 @@ async def get_campaign_logs(
     """Get campaign logs."""
     campaign = context["campaigns"].get(name)
     mock_kill_chain_engine.get_campaign.return_value = campaign
-    mock_kill_chain_engine.get_campaign_logs.return_value = [
-        {"timestamp": "2025-01-30T12:00:00Z", "sourcetype": "WinEventLog:Security", "event": "test"}
-        for _ in range(min(limit, 10))
-    ]
+    mock_kill_chain_engine.get_campaign_logs.return_value = [_LOG_TEMPLATE] * min(limit, 10)
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        campaign_id = campaign.id if campaign else name
-        response = await async_client.get(
-            f"/api/v1/attacks/campaigns/{campaign_id}/logs?limit={limit}",
-            headers=context.get("auth_headers", {}),
-        )
+    campaign_id = campaign.id if campaign else name
+    response = await async_client.get(
+        f"/api/v1/attacks/campaigns/{campaign_id}/logs?limit={limit}",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
 
-@when(parsers.parse('I list campaigns for instance "{name}"'))
+@when(parsers.re(r'I list campaigns for instance "(?P<name>[^"]+)"'))
 async def list_campaigns_for_instance(
     context: dict, name: str, async_client, mock_kill_chain_engine
 ) -> None:
@@ -377,21 +395,13 @@ async def list_campaigns_for_instance(
     instance = context["instances"].get(name)
     instance_id = instance.id if instance else name
 
-    # Filter campaigns for this instance
-    campaigns = [
-        c for c in context["campaigns"].values()
-        if hasattr(c, "target_instance_id") and c.target_instance_id == instance_id
-    ]
+    campaigns = context["campaigns_by_instance"].get(instance_id, [])
     mock_kill_chain_engine.list_campaigns.return_value = campaigns
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        response = await async_client.get(
-            f"/api/v1/attacks/campaigns?instance_id={instance_id}",
-            headers=context.get("auth_headers", {}),
-        )
+    response = await async_client.get(
+        f"/api/v1/attacks/campaigns?instance_id={instance_id}",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
@@ -425,14 +435,10 @@ async def execute_scenario(
     # Check if instance is running
     instance_status = instance.status.value if instance else "stopped"
 
-    with patch(
-        "faux_splunk_cloud.api.routes.attacks.kill_chain_engine",
-        mock_kill_chain_engine,
-    ):
-        response = await async_client.post(
-            f"/api/v1/attacks/scenarios/{scenario_id}/execute?target_instance_id={target_id}",
-            headers=context.get("auth_headers", {}),
-        )
+    response = await async_client.post(
+        f"/api/v1/attacks/scenarios/{scenario_id}/execute?target_instance_id={target_id}",
+        headers=context.get("auth_headers", {}),
+    )
 
     context["response"] = response
 
@@ -449,7 +455,6 @@ async def campaign_executes_detectable_technique(context: dict) -> None:
     """Simulate campaign executing a detectable technique."""
     campaign = context.get("current_campaign") or list(context["campaigns"].values())[0]
     # Simulate detection
-    from faux_splunk_cloud.attack_simulation import CampaignStatus
     campaign.status = CampaignStatus.DETECTED
     campaign.detected_at_step = len(campaign.steps) - 1 if campaign.steps else 0
 
@@ -506,7 +511,7 @@ def response_status_code(context: dict, code: int) -> None:
 @then("the response contains threat actors")
 def response_contains_threat_actors(context: dict) -> None:
     """Assert the response contains threat actors."""
-    data = context["response"].json()
+    data = _json(context)
     assert "threat_actors" in data
     assert len(data["threat_actors"]) > 0
 
@@ -514,7 +519,7 @@ def response_contains_threat_actors(context: dict) -> None:
 @then("each threat actor has a threat level")
 def each_actor_has_threat_level(context: dict) -> None:
     """Assert each threat actor has a threat level."""
-    data = context["response"].json()
+    data = _json(context)
     for actor in data["threat_actors"]:
         assert "threat_level" in actor
         assert actor["threat_level"] is not None
@@ -523,22 +528,22 @@ def each_actor_has_threat_level(context: dict) -> None:
 @then(parsers.parse('all returned actors have threat level "{level}"'))
 def all_actors_have_level(context: dict, level: str) -> None:
     """Assert all returned actors have the specified level."""
-    data = context["response"].json()
+    data = _json(context)
     for actor in data["threat_actors"]:
         assert actor["threat_level"] == level
 
 
-@then(parsers.parse('the response contains threat actor name "{name}"'))
+@then(parsers.re(r'the response contains threat actor name "(?P<name>[^"]+)"'))
 def response_contains_actor_name(context: dict, name: str) -> None:
     """Assert the response contains the specified threat actor name."""
-    data = context["response"].json()
+    data = _json(context)
     assert data.get("name") == name
 
 
 @then("the response contains MITRE ATT&CK techniques")
 def response_contains_techniques(context: dict) -> None:
     """Assert the response contains MITRE ATT&CK techniques."""
-    data = context["response"].json()
+    data = _json(context)
     assert "techniques" in data
     assert len(data["techniques"]) > 0
 
@@ -546,7 +551,7 @@ def response_contains_techniques(context: dict) -> None:
 @then("the response contains behavioral characteristics")
 def response_contains_behavioral(context: dict) -> None:
     """Assert the response contains behavioral characteristics."""
-    data = context["response"].json()
+    data = _json(context)
     # Could be in motivation, description, or other fields
     assert "motivation" in data or "description" in data
 
@@ -554,7 +559,7 @@ def response_contains_behavioral(context: dict) -> None:
 @then(parsers.parse('the campaign status is "{status}"'))
 def campaign_status_is(context: dict, status: str) -> None:
     """Assert the campaign has the expected status."""
-    data = context["response"].json()
+    data = _json(context)
     assert data.get("status") == status, (
         f"Expected status '{status}', got '{data.get('status')}'"
     )
@@ -563,7 +568,7 @@ def campaign_status_is(context: dict, status: str) -> None:
 @then("the campaign has a unique ID")
 def campaign_has_unique_id(context: dict) -> None:
     """Assert the campaign has a unique ID."""
-    data = context["response"].json()
+    data = _json(context)
     assert "id" in data
     assert data["id"]
 
@@ -571,7 +576,7 @@ def campaign_has_unique_id(context: dict) -> None:
 @then(parsers.parse('the error message contains "{text}"'))
 def error_message_contains(context: dict, text: str) -> None:
     """Assert the error message contains specific text."""
-    data = context["response"].json()
+    data = _json(context)
     error_msg = str(data.get("message", "") or data.get("detail", "")).lower()
     assert text.lower() in error_msg, f"Expected '{text}' in error: {data}"
 
@@ -579,28 +584,28 @@ def error_message_contains(context: dict, text: str) -> None:
 @then("the response contains current kill chain phase")
 def response_contains_current_phase(context: dict) -> None:
     """Assert the response contains the current phase."""
-    data = context["response"].json()
+    data = _json(context)
     assert "current_phase" in data
 
 
 @then("the response contains completed steps count")
 def response_contains_completed_steps(context: dict) -> None:
     """Assert the response contains completed steps count."""
-    data = context["response"].json()
+    data = _json(context)
     assert "completed_steps" in data
 
 
 @then("the response contains total steps count")
 def response_contains_total_steps(context: dict) -> None:
     """Assert the response contains total steps count."""
-    data = context["response"].json()
+    data = _json(context)
     assert "total_steps" in data
 
 
 @then("each step contains technique ID")
 def each_step_has_technique_id(context: dict) -> None:
     """Assert each step has a technique ID."""
-    data = context["response"].json()
+    data = _json(context)
     for step in data:
         assert "technique_id" in step
 
@@ -608,7 +613,7 @@ def each_step_has_technique_id(context: dict) -> None:
 @then("each step contains technique name")
 def each_step_has_technique_name(context: dict) -> None:
     """Assert each step has a technique name."""
-    data = context["response"].json()
+    data = _json(context)
     for step in data:
         assert "technique_name" in step
 
@@ -616,7 +621,7 @@ def each_step_has_technique_name(context: dict) -> None:
 @then("each step contains timestamp")
 def each_step_has_timestamp(context: dict) -> None:
     """Assert each step has a timestamp."""
-    data = context["response"].json()
+    data = _json(context)
     for step in data:
         assert "timestamp" in step
 
@@ -624,7 +629,7 @@ def each_step_has_timestamp(context: dict) -> None:
 @then("each step contains success status")
 def each_step_has_success_status(context: dict) -> None:
     """Assert each step has a success status."""
-    data = context["response"].json()
+    data = _json(context)
     for step in data:
         assert "success" in step
 
@@ -632,7 +637,7 @@ def each_step_has_success_status(context: dict) -> None:
 @then("the response contains log entries")
 def response_contains_log_entries(context: dict) -> None:
     """Assert the response contains log entries."""
-    data = context["response"].json()
+    data = _json(context)
     assert "logs" in data
     assert len(data["logs"]) > 0
 
@@ -640,7 +645,7 @@ def response_contains_log_entries(context: dict) -> None:
 @then("each log entry has a timestamp")
 def each_log_has_timestamp(context: dict) -> None:
     """Assert each log entry has a timestamp."""
-    data = context["response"].json()
+    data = _json(context)
     for log in data["logs"]:
         assert "timestamp" in log or "_time" in log
 
@@ -648,15 +653,15 @@ def each_log_has_timestamp(context: dict) -> None:
 @then("each log entry has a sourcetype")
 def each_log_has_sourcetype(context: dict) -> None:
     """Assert each log entry has a sourcetype."""
-    data = context["response"].json()
+    data = _json(context)
     for log in data["logs"]:
         assert "sourcetype" in log
 
 
-@then(parsers.parse('all returned campaigns target instance "{name}"'))
+@then(parsers.re(r'all returned campaigns target instance "(?P<name>[^"]+)"'))
 def all_campaigns_target_instance(context: dict, name: str) -> None:
     """Assert all returned campaigns target the specified instance."""
-    data = context["response"].json()
+    data = _json(context)
     instance = context["instances"].get(name)
     instance_id = instance.id if instance else name
 
@@ -667,14 +672,14 @@ def all_campaigns_target_instance(context: dict, name: str) -> None:
 @then("the response contains predefined scenarios")
 def response_contains_scenarios(context: dict) -> None:
     """Assert the response contains predefined scenarios."""
-    data = context["response"].json()
+    data = _json(context)
     assert len(data) > 0
 
 
 @then("each scenario has a threat level")
 def each_scenario_has_threat_level(context: dict) -> None:
     """Assert each scenario has a threat level."""
-    data = context["response"].json()
+    data = _json(context)
     for scenario in data:
         assert "threat_level" in scenario
 
@@ -682,7 +687,7 @@ def each_scenario_has_threat_level(context: dict) -> None:
 @then("each scenario has estimated duration")
 def each_scenario_has_duration(context: dict) -> None:
     """Assert each scenario has estimated duration."""
-    data = context["response"].json()
+    data = _json(context)
     for scenario in data:
         assert "estimated_duration_minutes" in scenario
 
@@ -690,7 +695,7 @@ def each_scenario_has_duration(context: dict) -> None:
 @then("a campaign is created and started")
 def campaign_is_created_and_started(context: dict) -> None:
     """Assert a campaign was created and started."""
-    data = context["response"].json()
+    data = _json(context)
     assert "id" in data
     assert data["status"] in ["running", "pending"]
 
@@ -698,7 +703,7 @@ def campaign_is_created_and_started(context: dict) -> None:
 @then("the campaign uses the scenario's threat actor")
 def campaign_uses_scenario_actor(context: dict) -> None:
     """Assert the campaign uses the correct threat actor."""
-    data = context["response"].json()
+    data = _json(context)
     assert "threat_actor_id" in data
     assert data["threat_actor_id"]
 
@@ -707,7 +712,7 @@ def campaign_uses_scenario_actor(context: dict) -> None:
 def campaign_phase_advances(context: dict, phase: str) -> None:
     """Assert the campaign phase has advanced."""
     # In mocked tests, we just verify the phase is present
-    data = context["response"].json()
+    data = _json(context)
     assert "current_phase" in data
 
 
@@ -722,7 +727,7 @@ def attack_steps_recorded(context: dict) -> None:
 def campaign_status_changes_to(context: dict, status: str) -> None:
     """Assert the campaign status changed."""
     campaign = context.get("current_campaign") or list(context["campaigns"].values())[0]
-    assert campaign.status.value == status
+    assert campaign.status is _CAMPAIGN_STATUS_BY_VALUE[status]
 
 
 @then("the detection step is recorded")
@@ -5,20 +5,90 @@ These steps implement the Gherkin scenarios defined in instance_lifecycle.featur
 All steps are designed to be deterministic and isolated.
 
 Note: Steps are synchronous because pytest-bdd doesn't natively support async steps.
-We use Starlette's TestClient for synchronous ASGI app testing.
+We use the shared Starlette TestClient from the ``client`` fixture for synchronous
+ASGI app testing.
 """
 
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
-from starlette.testclient import TestClient
 from pytest_bdd import given, parsers, scenarios, then, when
 
+from faux_splunk_cloud.api.deps import require_auth
+from faux_splunk_cloud.api.routes import instances as instances_routes
+from faux_splunk_cloud.models.instance import InstanceStatus, InstanceTopology
+
 # Load all scenarios from the feature file
 scenarios("../instance_lifecycle.feature")
 
+# Status strings from the feature file map straight to enum members
+_STATUS_BY_VALUE = {s.value: s for s in InstanceStatus}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_instance_manager(mock_instance_manager) -> Iterator[None]:
+    """
+    Point the instances routes at the shared mock manager for this module.
+
+    A plain attribute swap; the mock is session-scoped and reset after each
+    scenario, so one swap covers every request the steps make.
+    """
+    original = instances_routes.instance_manager
+    instances_routes.instance_manager = mock_instance_manager
+    yield
+    instances_routes.instance_manager = original
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _auth_override(app):
+    """Let write endpoints through ``require_auth`` for every scenario in this module."""
+    app.dependency_overrides[require_auth] = lambda: "test-user"
+    yield
+    app.dependency_overrides.pop(require_auth, None)
+
+
+@pytest.fixture
+def context() -> dict:
+    """
+    Scenario context with every key the instance steps use already in place.
+
+    Overrides the generic empty ``context`` so steps can index keys directly.
+    """
+    return {
+        "auth_headers": {},
+        "created_instance": None,
+        "instances_by_name": {},
+        "instances_by_id": {},
+        "instances_by_status": {},
+        "last_instance_name": None,
+    }
+
+
+def _remember_instance(context: dict, instance) -> None:
+    """Index an instance by name, id and status, and mark it as the most recent one."""
+    context["instances_by_name"][instance.name] = instance
+    context["instances_by_id"][instance.id] = instance
+    context["instances_by_status"].setdefault(instance.status, []).append(instance)
+    context["last_instance_name"] = instance.name
+
+
+def _resolve(context: dict, name: str):
+    """Return the instance registered as ``name`` (if any) and the id to request."""
+    instance = context["instances_by_name"].get(name)
+    return instance, (instance.id if instance else name)
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a response body once, caching the result on the response."""
+    if not hasattr(response, "_cached_json"):
+        response._cached_json = orjson.loads(response.content)
+    return response._cached_json
+
 
 # =============================================================================
 # Given Steps (Preconditions)
@@ -26,11 +96,8 @@ scenarios("../instance_lifecycle.feature")
 
 
 @given("the API server is running")
-def api_server_running(context: dict, app) -> None:
+def api_server_running(app) -> None:
     """Ensure the FastAPI app is available."""
-    context["app"] = app
-    context["response"] = None
-    context["instances"] = {}
 
 
 @given("I am authenticated as a developer")
@@ -42,57 +109,39 @@ def authenticated_as_developer(context: dict) -> None:
     }
 
 
-@given(parsers.parse('an instance "{name}" exists in "{status}" state'))
+@given(parsers.re(r'an instance "(?P<name>[^"]+)" exists in "(?P<status>[^"]+)" state'))
 def instance_exists_with_status(
     context: dict, name: str, status: str, make_instance
 ) -> None:
     """Create a mock instance with the specified status."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
+    status_enum = _STATUS_BY_VALUE[status.lower()]
+    _remember_instance(context, make_instance(name=name, status=status_enum))
 
-    status_enum = InstanceStatus(status.lower())
-    instance = make_instance(name=name, status=status_enum)
-    context["instances"][name] = instance
-    context["instances"][instance.id] = instance
 
-
-@given(parsers.parse("the instance expires in {hours:d} hour"))
-@given(parsers.parse("the instance expires in {hours:d} hours"))
+@given(parsers.re(r"the instance expires in (?P<hours>\d+) hours?"), converters={"hours": int})
 def instance_expires_in_hours(context: dict, hours: int, fixed_datetime: datetime) -> None:
     """Set instance expiration time."""
     # Get the last created instance
-    instance_name = list(context["instances"].keys())[-1]
-    instance = context["instances"][instance_name]
+    instance = context["instances_by_name"][context["last_instance_name"]]
     instance.expires_at = fixed_datetime + timedelta(hours=hours)
 
 
 @given("the following instances exist:")
-def multiple_instances_exist(context: dict, make_instance) -> None:
+def multiple_instances_exist(context: dict, datatable: list[list[str]], make_instances) -> None:
     """
-    Create multiple instances from a data table.
+    Create every instance in the step's data table in one batch.
 
-    Note: pytest-bdd doesn't support Cucumber-style data tables directly.
-    The data table values are defined inline here to match the feature file.
-    For dynamic data tables, use Scenario Outlines with Examples instead.
+    The first table row holds the column names (``name``, ``status``).
     """
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
-    # Data table from feature file:
-    # | name       | status   |
-    # | instance-a | running  |
-    # | instance-b | stopped  |
-    # | instance-c | running  |
-    instances_data = [
-        {"name": "instance-a", "status": "running"},
-        {"name": "instance-b", "status": "stopped"},
-        {"name": "instance-c", "status": "running"},
-    ]
-
-    for row in instances_data:
-        name = row["name"]
-        status = InstanceStatus(row["status"].lower())
-        instance = make_instance(name=name, status=status)
-        context["instances"][name] = instance
-        context["instances"][instance.id] = instance
+    header, *rows = datatable
+    instances_data = [dict(zip(header, row, strict=True)) for row in rows]
+
+    instances = make_instances(instances_data)
+    context["instances_by_name"].update((i.name, i) for i in instances)
+    context["instances_by_id"].update((i.id, i) for i in instances)
+    for instance in instances:
+        context["instances_by_status"].setdefault(instance.status, []).append(instance)
+    context["last_instance_name"] = instances[-1].name
 
 
 # =============================================================================
@@ -100,380 +149,246 @@ def multiple_instances_exist(context: dict, make_instance) -> None:
 # =============================================================================
 
 
-def mock_auth():
-    """Override auth dependency to always succeed."""
-    return "test-user"
-
-
-def setup_auth_override(app):
-    """Set up auth override for testing."""
-    from faux_splunk_cloud.api.deps import require_auth
-    app.dependency_overrides[require_auth] = mock_auth
-
-
-def cleanup_auth_override(app):
-    """Clean up auth override."""
-    app.dependency_overrides.clear()
-
-
-@when(parsers.parse('I create an instance with name "{name}"'))
+@when(parsers.re(r'I create an instance with name "(?P<name>[^"]+)"'), target_fixture="response")
 def create_instance_with_name(
-    context: dict, name: str, app, mock_instance_manager, make_instance
-) -> None:
+    context: dict, name: str, client, mock_instance_manager, make_instance
+) -> httpx.Response:
     """Create an instance with default configuration."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
     # Set up mock
     created_instance = make_instance(name=name, status=InstanceStatus.PROVISIONING)
     mock_instance_manager.create_instance.return_value = created_instance
-
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/v1/instances",
-                    json={"name": name},
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
     context["created_instance"] = created_instance
 
+    return client.post(
+        "/api/v1/instances",
+        json={"name": name},
+        headers=context["auth_headers"],
+    )
+
 
-@when(parsers.parse('I create an instance with name "{name}" and TTL {hours:d} hours'))
+@when(
+    parsers.re(r'I create an instance with name "(?P<name>[^"]+)" and TTL (?P<hours>\d+) hours'),
+    converters={"hours": int},
+    target_fixture="response",
+)
 def create_instance_with_ttl(
-    context: dict, name: str, hours: int, app, mock_instance_manager, make_instance
-) -> None:
+    context: dict, name: str, hours: int, client, mock_instance_manager, make_instance
+) -> httpx.Response:
     """Create an instance with custom TTL."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
     created_instance = make_instance(name=name, status=InstanceStatus.PROVISIONING)
     mock_instance_manager.create_instance.return_value = created_instance
-
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/v1/instances",
-                    json={"name": name, "ttl_hours": hours},
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
     context["created_instance"] = created_instance
 
+    return client.post(
+        "/api/v1/instances",
+        json={"name": name, "ttl_hours": hours},
+        headers=context["auth_headers"],
+    )
+
 
-@when(parsers.parse('I create an instance with topology "{topology}"'))
+@when(
+    parsers.re(r'I create an instance with topology "(?P<topology>[^"]+)"'),
+    target_fixture="response",
+)
 def create_instance_with_topology(
-    context: dict, topology: str, app, mock_instance_manager, make_instance
-) -> None:
+    context: dict, topology: str, client, mock_instance_manager, make_instance
+) -> httpx.Response:
     """Create an instance with specific topology."""
-    from faux_splunk_cloud.models.instance import InstanceStatus, InstanceTopology
-
     topology_enum = InstanceTopology(topology.lower())
     created_instance = make_instance(name="topology-test", status=InstanceStatus.PROVISIONING)
     created_instance.config.topology = topology_enum
     mock_instance_manager.create_instance.return_value = created_instance
-
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/v1/instances",
-                    json={
-                        "name": "topology-test",
-                        "config": {"topology": topology},
-                    },
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
     context["created_instance"] = created_instance
 
+    return client.post(
+        "/api/v1/instances",
+        json={
+            "name": "topology-test",
+            "config": {"topology": topology},
+        },
+        headers=context["auth_headers"],
+    )
+
 
-@when(parsers.parse('I start the instance "{name}"'))
+@when(parsers.re(r'I start the instance "(?P<name>[^"]+)"'), target_fixture="response")
 def start_instance(
-    context: dict, name: str, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, client, mock_instance_manager
+) -> httpx.Response:
     """Start a stopped instance."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     if instance:
         mock_instance_manager.get_instance.return_value = instance
         # Return instance with starting status
-        started_instance = MagicMock()
-        started_instance.id = instance.id
-        started_instance.status = InstanceStatus.STARTING
+        started_instance = SimpleNamespace(id=instance.id, status=InstanceStatus.STARTING)
         mock_instance_manager.start_instance.return_value = started_instance
 
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.post(
-                    f"/api/v1/instances/{instance.id if instance else name}/start",
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
+    return client.post(
+        f"/api/v1/instances/{instance_id}/start",
+        headers=context["auth_headers"],
+    )
 
 
-@when(parsers.parse('I stop the instance "{name}"'))
+@when(parsers.re(r'I stop the instance "(?P<name>[^"]+)"'), target_fixture="response")
 def stop_instance(
-    context: dict, name: str, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, client, mock_instance_manager
+) -> httpx.Response:
     """Stop a running instance."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     if instance:
         mock_instance_manager.get_instance.return_value = instance
         # Return instance with stopped status
-        stopped_instance = MagicMock()
-        stopped_instance.id = instance.id
-        stopped_instance.status = InstanceStatus.STOPPED
+        stopped_instance = SimpleNamespace(id=instance.id, status=InstanceStatus.STOPPED)
         mock_instance_manager.stop_instance.return_value = stopped_instance
 
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.post(
-                    f"/api/v1/instances/{instance.id if instance else name}/stop",
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
+    return client.post(
+        f"/api/v1/instances/{instance_id}/stop",
+        headers=context["auth_headers"],
+    )
 
 
-@when(parsers.parse('I destroy the instance "{name}"'))
+@when(parsers.re(r'I destroy the instance "(?P<name>[^"]+)"'), target_fixture="response")
 def destroy_instance(
-    context: dict, name: str, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, client, mock_instance_manager
+) -> httpx.Response:
     """Destroy an instance."""
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     if instance:
         mock_instance_manager.get_instance.return_value = instance
         mock_instance_manager.destroy_instance.return_value = None
 
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.delete(
-                    f"/api/v1/instances/{instance.id if instance else name}",
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
+    response = client.delete(
+        f"/api/v1/instances/{instance_id}",
+        headers=context["auth_headers"],
+    )
     # Remove from context after destruction
-    if name in context["instances"]:
-        del context["instances"][name]
+    if instance:
+        del context["instances_by_name"][name]
+        del context["instances_by_id"][instance.id]
+        context["instances_by_status"][instance.status].remove(instance)
+    return response
 
 
-@when("I list all instances")
+@when("I list all instances", target_fixture="response")
 def list_all_instances(
-    context: dict, app, mock_instance_manager
-) -> None:
+    context: dict, client, mock_instance_manager
+) -> httpx.Response:
     """List all instances."""
-    mock_instance_manager.list_instances.return_value = list(
-        v for k, v in context["instances"].items() if not k.startswith("fsc-")
-    )
+    mock_instance_manager.list_instances.return_value = list(context["instances_by_name"].values())
 
-    with patch(
-        "faux_splunk_cloud.api.routes.instances.instance_manager",
-        mock_instance_manager,
-    ):
-        with TestClient(app) as client:
-            response = client.get(
-                "/api/v1/instances",
-                headers=context.get("auth_headers", {}),
-            )
-
-    context["response"] = response
+    return client.get(
+        "/api/v1/instances",
+        headers=context["auth_headers"],
+    )
 
 
-@when(parsers.parse('I list instances with status "{status}"'))
+@when(parsers.re(r'I list instances with status "(?P<status>[^"]+)"'), target_fixture="response")
 def list_instances_by_status(
-    context: dict, status: str, app, mock_instance_manager
-) -> None:
+    context: dict, status: str, client, mock_instance_manager
+) -> httpx.Response:
     """List instances filtered by status."""
-    from faux_splunk_cloud.models.instance import InstanceStatus
-
-    status_enum = InstanceStatus(status.lower())
-    filtered = [
-        v
-        for k, v in context["instances"].items()
-        if not k.startswith("fsc-") and v.status == status_enum
-    ]
-    mock_instance_manager.list_instances.return_value = filtered
-
-    with patch(
-        "faux_splunk_cloud.api.routes.instances.instance_manager",
-        mock_instance_manager,
-    ):
-        with TestClient(app) as client:
-            response = client.get(
-                f"/api/v1/instances?status={status}",
-                headers=context.get("auth_headers", {}),
-            )
-
-    context["response"] = response
-
-
-@when(parsers.parse('I get the instance "{name}"'))
+    status_enum = _STATUS_BY_VALUE[status.lower()]
+    mock_instance_manager.list_instances.return_value = list(
+        context["instances_by_status"].get(status_enum, ())
+    )
+
+    return client.get(
+        f"/api/v1/instances?status={status}",
+        headers=context["auth_headers"],
+    )
+
+
+@when(parsers.re(r'I get the instance "(?P<name>[^"]+)"'), target_fixture="response")
 def get_instance(
-    context: dict, name: str, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, client, mock_instance_manager
+) -> httpx.Response:
     """Get instance details."""
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     mock_instance_manager.get_instance.return_value = instance
 
-    with patch(
-        "faux_splunk_cloud.api.routes.instances.instance_manager",
-        mock_instance_manager,
-    ):
-        with TestClient(app) as client:
-            instance_id = instance.id if instance else name
-            response = client.get(
-                f"/api/v1/instances/{instance_id}",
-                headers=context.get("auth_headers", {}),
-            )
-
-    context["response"] = response
+    return client.get(
+        f"/api/v1/instances/{instance_id}",
+        headers=context["auth_headers"],
+    )
 
 
-@when(parsers.parse("I extend the instance TTL by {hours:d} hours"))
+@when(
+    parsers.re(r"I extend the instance TTL by (?P<hours>\d+) hours"),
+    converters={"hours": int},
+    target_fixture="response",
+)
 def extend_instance_ttl(
-    context: dict, hours: int, app, mock_instance_manager
-) -> None:
+    context: dict, hours: int, client, mock_instance_manager
+) -> httpx.Response:
     """Extend instance TTL."""
     # Get the most recently referenced instance
-    instance_name = [k for k in context["instances"].keys() if not k.startswith("fsc-")][-1]
-    instance = context["instances"][instance_name]
+    instance = context["instances_by_name"][context["last_instance_name"]]
     mock_instance_manager.get_instance.return_value = instance
     mock_instance_manager.extend_ttl.return_value = instance
 
-    setup_auth_override(app)
-    try:
-        with patch(
-            "faux_splunk_cloud.api.routes.instances.instance_manager",
-            mock_instance_manager,
-        ):
-            with TestClient(app) as client:
-                response = client.post(
-                    f"/api/v1/instances/{instance.id}/extend",
-                    json={"hours": hours},
-                    headers=context.get("auth_headers", {}),
-                )
-    finally:
-        cleanup_auth_override(app)
-
-    context["response"] = response
-
-
-@when(parsers.parse('I check the health of instance "{name}"'))
+    return client.post(
+        f"/api/v1/instances/{instance.id}/extend",
+        json={"hours": hours},
+        headers=context["auth_headers"],
+    )
+
+
+@when(
+    parsers.re(r'I check the health of instance "(?P<name>[^"]+)"'),
+    target_fixture="response",
+)
 def check_instance_health(
-    context: dict, name: str, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, client, mock_instance_manager
+) -> httpx.Response:
     """Check instance health status."""
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     mock_instance_manager.get_instance.return_value = instance
     mock_instance_manager.get_instance_health.return_value = instance.status
 
-    with patch(
-        "faux_splunk_cloud.api.routes.instances.instance_manager",
-        mock_instance_manager,
-    ):
-        with TestClient(app) as client:
-            response = client.get(
-                f"/api/v1/instances/{instance.id}/health",
-                headers=context.get("auth_headers", {}),
-            )
-
-    context["response"] = response
+    return client.get(
+        f"/api/v1/instances/{instance_id}/health",
+        headers=context["auth_headers"],
+    )
 
 
-@when(parsers.parse('I get the logs for instance "{name}" with tail {lines:d}'))
+@when(
+    parsers.re(r'I get the logs for instance "(?P<name>[^"]+)" with tail (?P<lines>\d+)'),
+    converters={"lines": int},
+    target_fixture="response",
+)
 def get_instance_logs(
-    context: dict, name: str, lines: int, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, lines: int, client, mock_instance_manager
+) -> httpx.Response:
     """Get container logs for an instance."""
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     mock_instance_manager.get_instance.return_value = instance
     mock_instance_manager.get_instance_logs.return_value = "Line 1\nLine 2\nLine 3"
 
-    with patch(
-        "faux_splunk_cloud.api.routes.instances.instance_manager",
-        mock_instance_manager,
-    ):
-        with TestClient(app) as client:
-            response = client.get(
-                f"/api/v1/instances/{instance.id}/logs?tail={lines}",
-                headers=context.get("auth_headers", {}),
-            )
-
-    context["response"] = response
+    return client.get(
+        f"/api/v1/instances/{instance_id}/logs?tail={lines}",
+        headers=context["auth_headers"],
+    )
 
 
 @when(
-    parsers.parse(
-        'I wait for instance "{name}" to be ready with timeout {seconds:d} seconds'
-    )
+    parsers.re(
+        r'I wait for instance "(?P<name>[^"]+)" to be ready'
+        r" with timeout (?P<seconds>\d+) seconds"
+    ),
+    converters={"seconds": int},
+    target_fixture="response",
 )
 def wait_for_instance_ready(
-    context: dict, name: str, seconds: int, app, mock_instance_manager
-) -> None:
+    context: dict, name: str, seconds: int, client, mock_instance_manager
+) -> httpx.Response:
     """Wait for instance to become ready."""
-    instance = context["instances"].get(name)
+    instance, instance_id = _resolve(context, name)
     mock_instance_manager.get_instance.return_value = instance
     mock_instance_manager.wait_for_ready.return_value = instance
 
-    with patch(
-        "faux_splunk_cloud.api.routes.instances.instance_manager",
-        mock_instance_manager,
-    ):
-        with TestClient(app) as client:
-            response = client.get(
-                f"/api/v1/instances/{instance.id}/wait?timeout={seconds}",
-                headers=context.get("auth_headers", {}),
-            )
-
-    context["response"] = response
+    return client.get(
+        f"/api/v1/instances/{instance_id}/wait?timeout={seconds}",
+        headers=context["auth_headers"],
+    )
 
 
 # =============================================================================
@@ -481,27 +396,27 @@ def wait_for_instance_ready(
 # =============================================================================
 
 
-@then(parsers.parse("the response status code is {code:d}"))
-def response_status_code(context: dict, code: int) -> None:
+@then(parsers.re(r"the response status code is (?P<code>\d+)"), converters={"code": int})
+def response_status_code(response, code: int) -> None:
     """Assert the response status code."""
-    assert context["response"].status_code == code, (
-        f"Expected {code}, got {context['response'].status_code}: "
-        f"{context['response'].text}"
+    assert response.status_code == code, (
+        f"Expected {code}, got {response.status_code}: "
+        f"{response.text}"
     )
 
 
 @then("the response contains an instance ID")
-def response_contains_instance_id(context: dict) -> None:
+def response_contains_instance_id(response) -> None:
     """Assert the response contains an instance ID."""
-    data = context["response"].json()
+    data = _json(response)
     assert "id" in data, f"Response missing 'id': {data}"
     assert data["id"], "Instance ID is empty"
 
 
-@then(parsers.parse('the instance status is "{status}"'))
-def instance_status_is(context: dict, status: str) -> None:
+@then(parsers.re(r'the instance status is "(?P<status>[^"]+)"'))
+def instance_status_is(response, status: str) -> None:
     """Assert the instance has the expected status."""
-    data = context["response"].json()
+    data = _json(response)
     assert data.get("status") == status, (
         f"Expected status '{status}', got '{data.get('status')}'"
     )
@@ -510,7 +425,7 @@ def instance_status_is(context: dict, status: str) -> None:
 @then("the instance has default indexes configured")
 def instance_has_default_indexes(context: dict) -> None:
     """Assert the instance has default indexes configured."""
-    instance = context.get("created_instance")
+    instance = context["created_instance"]
     assert instance is not None
     # Check that create_default_indexes is enabled (Victoria Experience default)
     assert instance.config.create_default_indexes is True, (
@@ -518,13 +433,16 @@ def instance_has_default_indexes(context: dict) -> None:
     )
 
 
-@then(parsers.parse("the instance expires in approximately {hours:d} hours"))
+@then(
+    parsers.re(r"the instance expires in approximately (?P<hours>\d+) hours"),
+    converters={"hours": int},
+)
 def instance_expires_in_hours_approx(
-    context: dict, hours: int, fixed_datetime: datetime
+    response, hours: int, fixed_datetime: datetime
 ) -> None:
     """Assert the instance expires within an hour of the expected time."""
-    data = context["response"].json()
-    expires_at = datetime.fromisoformat(data["expires_at"].replace("Z", "+00:00"))
+    data = _json(response)
+    expires_at = datetime.fromisoformat(data["expires_at"])
     expected = fixed_datetime + timedelta(hours=hours)
 
     # Allow 1 hour tolerance
@@ -532,40 +450,40 @@ def instance_expires_in_hours_approx(
     assert delta < 3600, f"Expiration time off by {delta} seconds"
 
 
-@then(parsers.parse('the instance configuration shows topology "{topology}"'))
-def instance_topology_is(context: dict, topology: str) -> None:
+@then(parsers.re(r'the instance configuration shows topology "(?P<topology>[^"]+)"'))
+def instance_topology_is(response, topology: str) -> None:
     """Assert the instance has the expected topology."""
-    data = context["response"].json()
+    data = _json(response)
     assert data.get("config", {}).get("topology") == topology
 
 
-@then(parsers.parse('the error message contains "{text}"'))
-def error_message_contains(context: dict, text: str) -> None:
+@then(parsers.re(r'the error message contains "(?P<text>[^"]+)"'))
+def error_message_contains(response, text: str) -> None:
     """Assert the error message contains specific text."""
-    data = context["response"].json()
+    data = _json(response)
     error_msg = str(data.get("message", "") or data.get("detail", "")).lower()
     assert text.lower() in error_msg, f"Expected '{text}' in error: {data}"
 
 
 @then("the instance no longer exists")
-def instance_no_longer_exists(context: dict) -> None:
+def instance_no_longer_exists(response) -> None:
     """Assert the instance has been removed."""
     # The destroy step already removes from context
-    assert context["response"].status_code == 204
+    assert response.status_code == 204
 
 
-@then(parsers.parse("the response contains {count:d} instances"))
-def response_contains_n_instances(context: dict, count: int) -> None:
+@then(parsers.re(r"the response contains (?P<count>\d+) instances"), converters={"count": int})
+def response_contains_n_instances(response, count: int) -> None:
     """Assert the response contains the expected number of instances."""
-    data = context["response"].json()
+    data = _json(response)
     instances = data.get("instances", [])
     assert len(instances) == count, f"Expected {count} instances, got {len(instances)}"
 
 
-@then(parsers.parse('all returned instances have status "{status}"'))
-def all_instances_have_status(context: dict, status: str) -> None:
+@then(parsers.re(r'all returned instances have status "(?P<status>[^"]+)"'))
+def all_instances_have_status(response, status: str) -> None:
     """Assert all returned instances have the expected status."""
-    data = context["response"].json()
+    data = _json(response)
     instances = data.get("instances", [])
     for instance in instances:
         assert instance.get("status") == status, (
@@ -575,9 +493,9 @@ def all_instances_have_status(context: dict, status: str) -> None:
 
 
 @then("the response contains instance endpoints")
-def response_contains_endpoints(context: dict) -> None:
+def response_contains_endpoints(response) -> None:
     """Assert the response contains endpoint URLs."""
-    data = context["response"].json()
+    data = _json(response)
     endpoints = data.get("endpoints", {})
     assert "web_url" in endpoints
     assert "api_url" in endpoints
@@ -585,24 +503,24 @@ def response_contains_endpoints(context: dict) -> None:
 
 
 @then("the response contains instance credentials")
-def response_contains_credentials(context: dict) -> None:
+def response_contains_credentials(response) -> None:
     """Assert the response contains credentials."""
-    data = context["response"].json()
+    data = _json(response)
     credentials = data.get("credentials", {})
     assert "admin_username" in credentials
     assert "admin_password" in credentials
 
 
-@then(parsers.parse('the health status is "{status}"'))
-def health_status_is(context: dict, status: str) -> None:
+@then(parsers.re(r'the health status is "(?P<status>[^"]+)"'))
+def health_status_is(response, status: str) -> None:
     """Assert the health status."""
-    data = context["response"].json()
+    data = _json(response)
     assert data.get("status") == status
 
 
 @then("the response contains log lines")
-def response_contains_logs(context: dict) -> None:
+def response_contains_logs(response) -> None:
     """Assert the response contains log content."""
-    data = context["response"].json()
+    data = _json(response)
     logs = data.get("logs", "")
     assert len(logs) > 0, "No logs returned"
@@ -6,68 +6,130 @@ and authorization checks in isolation.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from freezegun import freeze_time
+from pydantic import SecretStr
 
+from faux_splunk_cloud.config import settings
 from faux_splunk_cloud.services.auth import (
     AuthService,
-    hash_password,
-    verify_password,
+    TokenData,
 )
 
 
+@pytest.fixture(scope="module")
+def hashed_cache(auth_service):
+    """Hash each distinct password once per module; BCrypt is slow by design."""
+    cache: dict[str, str] = {}
+
+    def _hash(password: str) -> str:
+        if password not in cache:
+            cache[password] = auth_service.hash_password(password)
+        return cache[password]
+
+    return _hash
+
+
+@pytest.fixture(scope="module")
+def auth_service():
+    """
+    Auth service shared by the module; it holds no per-test state.
+
+    ``AuthService`` reads its settings at construction, so they are patched
+    only while the service is built. Passwords are hashed with the minimum
+    BCrypt cost factor; the hashing tests don't depend on its strength.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "jwt_secret_key", SecretStr("test-secret-key-for-testing"))
+        mp.setattr(settings, "jwt_algorithm", "HS256")
+        mp.setattr(settings, "jwt_expiration_hours", 24)
+        mp.setattr(settings, "password_hash_rounds", 4)
+        return AuthService()
+
+
+@pytest.fixture
+def frozen_clock():
+    """Freeze time once; tests advance it with ``tick`` instead of re-freezing."""
+    with freeze_time("2025-01-30 12:00:00") as frozen:
+        yield frozen
+
+
+@pytest.fixture
+def make_token_data():
+    """Factory for TokenData payloads, skipping the JWT encode/decode round trip."""
+
+    def _make(**kwargs) -> TokenData:
+        now = datetime.now(timezone.utc)
+        kwargs.setdefault("sub", "admin")
+        kwargs.setdefault("stack", "fsc-test-instance")
+        kwargs.setdefault("iat", now)
+        kwargs.setdefault("exp", now + timedelta(hours=1))
+        kwargs.setdefault("roles", [])
+        kwargs.setdefault("capabilities", [])
+        return TokenData(**kwargs)
+
+    return _make
+
+
 class TestPasswordHashing:
     """Tests for password hashing functions."""
 
     @pytest.mark.unit
-    def test_hash_password_returns_hash(self):
+    def test_hash_password_returns_hash(self, hashed_cache):
         """Test password hashing returns a hash string."""
         password = "SecurePassword123!"
-        hashed = hash_password(password)
+        hashed = hashed_cache(password)
 
         assert hashed != password
         assert len(hashed) > 20  # BCrypt hashes are long
         assert hashed.startswith("$2")  # BCrypt prefix
 
     @pytest.mark.unit
-    def test_hash_is_deterministic_with_same_salt(self):
+    def test_hash_uses_configured_rounds(self, hashed_cache):
+        """Test the hash records the cost factor from settings."""
+        hashed = hashed_cache("SecurePassword123!")
+
+        assert hashed.split("$")[2] == "04"
+
+    @pytest.mark.unit
+    def test_hash_is_deterministic_with_same_salt(self, auth_service, hashed_cache):
         """Test that same password with same salt produces same hash."""
         # Note: BCrypt uses random salt by default, so hashes differ
         # This test validates the verify function works
         password = "TestPassword456!"
-        hashed = hash_password(password)
+        hashed = hashed_cache(password)
 
-        assert verify_password(password, hashed)
+        assert auth_service.verify_password(password, hashed)
 
     @pytest.mark.unit
-    def test_verify_password_correct(self):
+    def test_verify_password_correct(self, auth_service, hashed_cache):
         """Test verifying correct password returns True."""
         password = "CorrectPassword!"
-        hashed = hash_password(password)
+        hashed = hashed_cache(password)
 
-        assert verify_password(password, hashed) is True
+        assert auth_service.verify_password(password, hashed) is True
 
     @pytest.mark.unit
-    def test_verify_password_incorrect(self):
+    def test_verify_password_incorrect(self, auth_service, hashed_cache):
         """Test verifying incorrect password returns False."""
         password = "CorrectPassword!"
-        hashed = hash_password(password)
+        hashed = hashed_cache(password)
 
-        assert verify_password("WrongPassword!", hashed) is False
+        assert auth_service.verify_password("WrongPassword!", hashed) is False
 
     @pytest.mark.unit
-    def test_verify_empty_password(self):
+    def test_verify_empty_password(self, auth_service, hashed_cache):
         """Test verifying empty password against hash."""
         password = "SomePassword!"
-        hashed = hash_password(password)
+        hashed = hashed_cache(password)
 
-        assert verify_password("", hashed) is False
+        assert auth_service.verify_password("", hashed) is False
 
     @pytest.mark.unit
-    def test_hash_different_passwords_differ(self):
+    def test_hash_different_passwords_differ(self, hashed_cache):
         """Test different passwords produce different hashes."""
-        hash1 = hash_password("Password1!")
-        hash2 = hash_password("Password2!")
+        hash1 = hashed_cache("Password1!")
+        hash2 = hashed_cache("Password2!")
 
         # Even with different salts, hashes should be different
         assert hash1 != hash2
@@ -76,15 +138,6 @@ class TestPasswordHashing:
 class TestAuthService:
     """Tests for AuthService class."""
 
-    @pytest.fixture
-    def auth_service(self):
-        """Create an auth service for testing."""
-        return AuthService(
-            secret_key="test-secret-key-for-testing",
-            algorithm="HS256",
-            expiration_hours=24,
-        )
-
     @pytest.mark.unit
     def test_create_acs_token(self, auth_service):
         """Test creating an ACS token."""
@@ -112,8 +165,8 @@ class TestAuthService:
         data = auth_service.decode_token(token)
 
         assert data is not None
-        assert data.instance_id == "fsc-test-002"
-        assert data.username == "testuser"
+        assert data.stack == "fsc-test-002"
+        assert data.sub == "testuser"
         assert "user" in data.roles
 
     @pytest.mark.unit
@@ -142,8 +195,7 @@ class TestAuthService:
         assert data is None
 
     @pytest.mark.unit
-    @freeze_time("2025-01-30 12:00:00")
-    def test_token_expiration(self, auth_service):
+    def test_token_expiration(self, auth_service, frozen_clock):
         """Test token expires after configured time."""
         token = auth_service.create_acs_token(
             instance_id="fsc-test-004",
@@ -158,9 +210,9 @@ class TestAuthService:
         assert data is not None
 
         # Fast forward 2 hours
-        with freeze_time("2025-01-30 14:00:00"):
-            data = auth_service.decode_token(token)
-            assert data is None  # Expired
+        frozen_clock.tick(timedelta(hours=2))
+        data = auth_service.decode_token(token)
+        assert data is None  # Expired
 
     @pytest.mark.unit
     def test_validate_token_for_stack(self, auth_service):
@@ -181,33 +233,29 @@ class TestAuthService:
         assert data is None
 
     @pytest.mark.unit
-    def test_has_capability(self, auth_service):
+    def test_has_capability(self, auth_service, make_token_data):
         """Test checking if token has specific capability."""
-        token = auth_service.create_acs_token(
-            instance_id="fsc-test-005",
-            username="admin",
+        data = make_token_data(
+            stack="fsc-test-005",
+            sub="admin",
             roles=["admin"],
             capabilities=["edit_indexes", "edit_tokens"],
         )
 
-        data = auth_service.decode_token(token)
-
         assert auth_service.has_capability(data, "edit_indexes") is True
         assert auth_service.has_capability(data, "edit_tokens") is True
         assert auth_service.has_capability(data, "delete_all") is False
 
     @pytest.mark.unit
-    def test_has_role(self, auth_service):
+    def test_has_role(self, auth_service, make_token_data):
         """Test checking if token has specific role."""
-        token = auth_service.create_acs_token(
-            instance_id="fsc-test-006",
-            username="poweruser",
+        data = make_token_data(
+            stack="fsc-test-006",
+            sub="poweruser",
             roles=["power", "user"],
             capabilities=[],
         )
 
-        data = auth_service.decode_token(token)
-
         assert auth_service.has_role(data, "power") is True
         assert auth_service.has_role(data, "user") is True
         assert auth_service.has_role(data, "admin") is False
@@ -216,14 +264,6 @@ class TestAuthService:
 class TestTokenData:
     """Tests for TokenData structure."""
 
-    @pytest.fixture
-    def auth_service(self):
-        return AuthService(
-            secret_key="test-key",
-            algorithm="HS256",
-            expiration_hours=24,
-        )
-
     @pytest.mark.unit
     def test_token_data_fields(self, auth_service):
         """Test TokenData contains all expected fields."""
@@ -236,11 +276,9 @@ class TestTokenData:
 
         data = auth_service.decode_token(token)
 
-        assert hasattr(data, "instance_id")
-        assert hasattr(data, "username")
-        assert hasattr(data, "roles")
-        assert hasattr(data, "capabilities")
-        assert hasattr(data, "exp")  # Expiration
+        expected = {"sub", "stack", "exp", "iat", "roles", "capabilities"}
+        assert data is not None
+        assert data.model_dump().keys() == expected
 
     @pytest.mark.unit
     def test_token_data_immutability(self, auth_service):
@@ -3,6 +3,8 @@ Unit tests for Pydantic models.
 
 These tests validate model construction, validation, and serialization
 without any external dependencies.
+
+PYTEST_DONT_REWRITE
 """
 
 import pytest
@@ -19,6 +21,39 @@ from faux_splunk_cloud.models.instance import (
     InstanceTopology,
 )
 
+# Validate request payloads straight through pydantic-core; the public
+# constructor is still covered by the other InstanceCreate tests.
+_INSTANCE_CREATE_VALIDATOR = InstanceCreate.__pydantic_validator__
+
+# Instance names are limited to 63 characters
+_MAX_LENGTH_NAME = "a" * 63
+_OVER_MAX_LENGTH_NAME = "a" * 64
+
+# Read-only default model shared by the defaults-only endpoint checks
+_EMPTY_ENDPOINTS = InstanceEndpoints()
+
+_EXPECTED_STATUSES = frozenset(
+    {
+        "pending",
+        "provisioning",
+        "starting",
+        "running",
+        "stopping",
+        "stopped",
+        "error",
+        "terminated",
+    }
+)
+
+_EXPECTED_TOPOLOGIES = frozenset(
+    {
+        "standalone",
+        "distributed_minimal",
+        "distributed_clustered",
+        "victoria_full",
+    }
+)
+
 
 class TestInstanceConfig:
     """Tests for InstanceConfig model."""
@@ -28,11 +63,14 @@ class TestInstanceConfig:
         """Test creating config with all defaults."""
         config = InstanceConfig()
 
-        assert config.topology == InstanceTopology.STANDALONE
-        assert config.splunk_version == "9.3.2"
-        assert config.experience == "victoria"
-        assert config.memory_mb == 2048
-        assert config.cpu_cores == 1.0
+        actual = (
+            config.topology,
+            config.splunk_version,
+            config.experience,
+            config.memory_mb,
+            config.cpu_cores,
+        )
+        assert actual == (InstanceTopology.STANDALONE, "9.3.2", "victoria", 2048, 1.0), actual
 
     @pytest.mark.unit
     def test_config_with_custom_values(self):
@@ -44,17 +82,20 @@ class TestInstanceConfig:
             cpu_cores=2.0,
         )
 
-        assert config.topology == InstanceTopology.DISTRIBUTED_MINIMAL
-        assert config.splunk_version == "9.2.0"
-        assert config.memory_mb == 4096
-        assert config.cpu_cores == 2.0
+        actual = (
+            config.topology,
+            config.splunk_version,
+            config.memory_mb,
+            config.cpu_cores,
+        )
+        assert actual == (InstanceTopology.DISTRIBUTED_MINIMAL, "9.2.0", 4096, 2.0), actual
 
     @pytest.mark.unit
-    def test_all_topologies_valid(self):
+    @pytest.mark.parametrize("topology", list(InstanceTopology))
+    def test_all_topologies_valid(self, topology):
         """Test all topology enum values are accepted."""
-        for topology in InstanceTopology:
-            config = InstanceConfig(topology=topology)
-            assert config.topology == topology
+        config = InstanceConfig(topology=topology)
+        assert config.topology == topology
 
 
 class TestInstanceCreate:
@@ -77,35 +118,54 @@ class TestInstanceCreate:
         assert request.ttl_hours == 4
 
     @pytest.mark.unit
-    def test_valid_instance_names(self):
-        """Test valid instance name patterns."""
-        valid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "test",
             "test-instance",
             "my-splunk-01",
-            "a" * 63,  # Max length
-        ]
-
-        for name in valid_names:
-            request = InstanceCreate(name=name)
-            assert request.name == name
+            _MAX_LENGTH_NAME,
+        ],
+    )
+    def test_valid_instance_names(self, name):
+        """Test valid instance name patterns."""
+        request = _INSTANCE_CREATE_VALIDATOR.validate_python({"name": name})
+        assert request.name == name
 
     @pytest.mark.unit
-    def test_invalid_instance_names(self):
-        """Test invalid instance name patterns are rejected."""
-        invalid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "",  # Empty
             "Test",  # Uppercase
             "test_instance",  # Underscore
             "test instance",  # Space
             "-test",  # Leading hyphen
             "test-",  # Trailing hyphen
-            "a" * 64,  # Too long
-        ]
+            _OVER_MAX_LENGTH_NAME,
+        ],
+    )
+    def test_invalid_instance_names(self, name):
+        """Test invalid instance name patterns are rejected."""
+        with pytest.raises(ValidationError):
+            _INSTANCE_CREATE_VALIDATOR.validate_python({"name": name})
 
-        for name in invalid_names:
-            with pytest.raises(ValidationError):
-                InstanceCreate(name=name)
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("name", "valid"),
+        [
+            ("test", True),
+            ("my-splunk-01", True),
+            ("Test", False),  # Uppercase
+            ("test_instance", False),  # Underscore
+            ("test instance", False),  # Space
+            ("-test", False),  # Leading hyphen
+            ("test-", False),  # Trailing hyphen
+        ],
+    )
+    def test_name_pattern(self, name, valid):
+        """Test the name character rule on its own, without building a model."""
+        assert bool(InstanceCreate._NAME_RE.fullmatch(name)) is valid
 
     @pytest.mark.unit
     def test_ttl_range_validation(self):
@@ -136,16 +196,14 @@ class TestInstanceEndpoints:
             s2s_port=9997,
         )
 
-        assert endpoints.web_url == "http://localhost:8000"
-        assert endpoints.s2s_port == 9997
+        actual = (endpoints.web_url, endpoints.s2s_port)
+        assert actual == ("http://localhost:8000", 9997), actual
 
     @pytest.mark.unit
     def test_optional_endpoints(self):
         """Test endpoints with optional fields."""
-        endpoints = InstanceEndpoints()
-
-        assert endpoints.web_url is None
-        assert endpoints.s2s_port is None
+        assert _EMPTY_ENDPOINTS.web_url is None
+        assert _EMPTY_ENDPOINTS.s2s_port is None
 
 
 class TestInstanceCredentials:
@@ -161,8 +219,13 @@ class TestInstanceCredentials:
             hec_token="hec-xyz",
         )
 
-        assert creds.admin_username == "admin"
-        assert creds.admin_password == "secret123"
+        actual = (
+            creds.admin_username,
+            creds.admin_password,
+            creds.acs_token,
+            creds.hec_token,
+        )
+        assert actual == ("admin", "secret123", "token-abc", "hec-xyz"), actual
 
 
 class TestInstance:
@@ -178,11 +241,11 @@ class TestInstance:
         assert instance.status == InstanceStatus.RUNNING
 
     @pytest.mark.unit
-    def test_instance_status_transitions(self, make_instance):
+    @pytest.mark.parametrize("status", list(InstanceStatus))
+    def test_instance_status_transitions(self, make_instance, status):
         """Test instance can have different statuses."""
-        for status in InstanceStatus:
-            instance = make_instance(status=status)
-            assert instance.status == status
+        instance = make_instance(status=status)
+        assert instance.status == status
 
     @pytest.mark.unit
     def test_instance_serialization(self, make_instance):
@@ -214,19 +277,9 @@ class TestInstanceStatus:
     @pytest.mark.unit
     def test_all_statuses_defined(self):
         """Ensure all expected statuses are defined."""
-        expected = {
-            "pending",
-            "provisioning",
-            "starting",
-            "running",
-            "stopping",
-            "stopped",
-            "error",
-            "terminated",
-        }
-
-        actual = {s.value for s in InstanceStatus}
-        assert expected == actual
+        defined = InstanceStatus._value2member_map_.keys()
+        assert len(InstanceStatus) == len(_EXPECTED_STATUSES), sorted(defined)
+        assert all(v in defined for v in _EXPECTED_STATUSES), sorted(_EXPECTED_STATUSES - defined)
 
     @pytest.mark.unit
     def test_status_from_string(self):
@@ -241,12 +294,8 @@ class TestInstanceTopology:
     @pytest.mark.unit
     def test_all_topologies_defined(self):
         """Ensure all expected topologies are defined."""
-        expected = {
-            "standalone",
-            "distributed_minimal",
-            "distributed_clustered",
-            "victoria_full",
-        }
-
-        actual = {t.value for t in InstanceTopology}
-        assert expected == actual
+        defined = InstanceTopology._value2member_map_.keys()
+        assert len(InstanceTopology) == len(_EXPECTED_TOPOLOGIES), sorted(defined)
+        assert all(v in defined for v in _EXPECTED_TOPOLOGIES), sorted(
+            _EXPECTED_TOPOLOGIES - defined
+        )